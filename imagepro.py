@@ -4,14 +4,37 @@ ImagePro - Command-line tool for responsive image processing
 """
 
 import argparse
+import glob
+import io
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from PIL import Image
 import os
 
 
 __version__ = "1.0.0"
 
+# Lowest JPEG quality tried when searching for a size budget
+MIN_BUDGET_QUALITY = 20
+
+
+@dataclass
+class OutputFile:
+    """Metadata for one resized image written to disk."""
+
+    # Explicit slots keep rows compact without requiring Python 3.10
+    __slots__ = ('path', 'filename', 'width', 'height', 'size_kb', 'quality')
+
+    path: Path
+    filename: str
+    width: int
+    height: int
+    size_kb: float
+    quality: int
+
 
 def parse_sizes(size_str):
     """Parse comma-separated list of sizes into integers."""
@@ -32,12 +55,303 @@ def validate_jpeg(filepath):
     return True
 
 
-def get_file_size_kb(filepath):
-    """Get file size in KB."""
-    return os.path.getsize(filepath) / 1024
+def available_cpus():
+    """Get the number of CPUs this process may run on."""
+    # sched_getaffinity respects cgroup/taskset limits in containers, but is
+    # not available on macOS or Windows
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
 
+def _encode_jpeg(img, quality, optimize, subsampling):
+    """Encode an image as JPEG in memory and return the encoded bytes."""
+    buffer = io.BytesIO()
+    # Write no EXIF or ICC segments; metadata is stripped for web output
+    img.save(buffer, 'JPEG', quality=quality, optimize=optimize,
+             subsampling=subsampling, exif=b'', icc_profile=None)
+    return buffer.getbuffer()
 
-def resize_image(input_path, output_dir, sizes, dimension='width', quality=90):
+
+def _encode_within_budget(encode, quality, budget_kb):
+    """
+    Find the highest JPEG quality whose output fits within a size budget.
+
+    Only the encoder runs for each attempt, so the decoded and resized
+    pixels are reused across the binary search.
+
+    Args:
+        encode: Callable taking a quality and returning the encoded bytes
+        quality: Highest quality to try
+        budget_kb: Maximum output size in KB
+
+    Returns:
+        Tuple of (encoded bytes, quality used). If no quality fits, the
+        output at the lowest quality tried is returned.
+    """
+    data = encode(quality)
+    if len(data) / 1024 <= budget_kb:
+        return data, quality
+
+    smallest = (data, quality)
+    best = None
+    low, high = min(MIN_BUDGET_QUALITY, quality), quality - 1
+    while low <= high:
+        mid = (low + high) // 2
+        data = encode(mid)
+        if len(data) / 1024 <= budget_kb:
+            best = (data, mid)
+            low = mid + 1
+        else:
+            smallest = (data, mid)
+            high = mid - 1
+
+    return best or smallest
+
+
+def _flatten_to_rgb(img):
+    """Convert an image to RGB, compositing any transparency onto white."""
+    from PIL import Image
+
+    if img.mode == 'P' and 'transparency' not in img.info:
+        # Opaque palette image: there is no alpha channel to blend on
+        img = img.convert('RGB')
+    elif img.mode in ('RGBA', 'LA', 'P'):
+        # Handle transparency by converting to RGB with white background.
+        # Using the image as its own mask blends on its alpha band in one
+        # pass, without splitting every channel into a separate image.
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img)
+        img = background
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    return img
+
+
+def _resize(img, new_width, new_height):
+    """Resize an image, returning it unchanged if it is already that size."""
+    from PIL import Image
+
+    if img.size == (new_width, new_height):
+        return img
+
+    # Resize image using high-quality Lanczos resampling. For large
+    # downscales, reducing_gap first shrinks by an integer factor with the
+    # cheap reduce() box filter, leaving Lanczos within 2x of the target.
+    return img.resize((new_width, new_height), Image.Resampling.LANCZOS,
+                      reducing_gap=2.0)
+
+
+def _render_size(img, output_path, new_width, new_height, quality, optimize,
+                 subsampling, budget_kb=None):
+    """Resize img to one output size, save it as JPEG, and return its metadata."""
+    resized_img = _resize(img, new_width, new_height)
+
+    # Encode in memory so the file size is known without a stat() call on
+    # the written file
+    if budget_kb is None:
+        data = _encode_jpeg(resized_img, quality, optimize, subsampling)
+    else:
+        data, quality = _encode_within_budget(
+            lambda q: _encode_jpeg(resized_img, q, optimize, subsampling),
+            quality, budget_kb)
+    output_path.write_bytes(data)
+    file_size = len(data) / 1024
+
+    return OutputFile(
+        path=output_path,
+        filename=output_path.name,
+        width=new_width,
+        height=new_height,
+        size_kb=file_size,
+        quality=quality
+    )
+
+
+def _decode_image(input_path, sizes, dimension):
+    """
+    Decode an image as RGB, letting JPEG sources downscale in the DCT domain.
+
+    The header is parsed once here; callers take the original dimensions
+    from the return value instead of opening the file again.
+
+    Returns:
+        Tuple of (loaded image, original (width, height))
+    """
+    from PIL import Image
+
+    with open(input_path, 'rb') as f:
+        img = Image.open(f)
+        orig_width, orig_height = img.size
+
+        # Request twice the largest output size so Lanczos still has detail
+        # to work with; draft() is a no-op for non-JPEG sources.
+        orig_size = orig_width if dimension == 'width' else orig_height
+        largest = max((s for s in sizes if s <= orig_size), default=None)
+        if largest is not None:
+            scale = largest / orig_size
+            img.draft('RGB', (max(1, int(orig_width * scale * 2)),
+                              max(1, int(orig_height * scale * 2))))
+
+        img.load()
+
+    # Convert once here rather than after every resize. Flattening before
+    # resampling differs from resizing RGBA only at hard alpha edges, which
+    # does not matter for JPEG output, and palette sources now get Lanczos
+    # instead of the nearest-neighbour resize Pillow uses for 'P' mode.
+    img = _flatten_to_rgb(img)
+
+    return img, (orig_width, orig_height)
+
+
+def _plan_sizes(orig_width, orig_height, sizes, dimension):
+    """
+    Work out the output dimensions for each requested size.
+
+    Returns:
+        Tuple of (list of (size, new_width, new_height) jobs, skipped sizes
+        with reasons)
+    """
+    jobs = []
+    skipped_sizes = []
+
+    # Choose the dimension calculation once rather than branching per size.
+    # The other axis is rounded with exact integer math, and never drops
+    # below 1px for extreme aspect ratios.
+    if dimension == 'width':
+        limit, limit_desc = orig_width, f"{orig_width}px wide"
+
+        def calc_dims(size):
+            return size, max(1, (size * orig_height + orig_width // 2) // orig_width)
+    else:  # height
+        limit, limit_desc = orig_height, f"{orig_height}px tall"
+
+        def calc_dims(size):
+            return max(1, (size * orig_width + orig_height // 2) // orig_height), size
+
+    # Calculate new dimensions for each size
+    for size in sizes:
+        if size > limit:
+            skipped_sizes.append((size, f"original is only {limit_desc}"))
+            continue
+        new_width, new_height = calc_dims(size)
+        jobs.append((size, new_width, new_height))
+
+    return jobs, skipped_sizes
+
+
+def _render_sizes(img, orig_width, orig_height, input_path, output_dir, sizes,
+                  dimension, quality, optimize, subsampling, budget_kb):
+    """Render every requested size from a decoded image."""
+    # Prepare output
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Get base name and extension
+    base_name = input_path.stem
+    extension = input_path.suffix
+
+    jobs, skipped_sizes = _plan_sizes(orig_width, orig_height, sizes, dimension)
+
+    created_files = []
+    if jobs:
+        # Resize the largest size from the decoded source, then derive the
+        # smaller sizes from that result. Like a mipmap chain, this touches
+        # far fewer pixels than resampling the full source for every size.
+        _, largest_width, largest_height = max(jobs, key=lambda job: job[1])
+        source = _resize(img, largest_width, largest_height)
+
+        # Each size is independent, so render them concurrently. Pillow
+        # releases the GIL while resampling and encoding, so threads run in
+        # parallel and share the source image without copying it.
+        def render(job):
+            size, new_width, new_height = job
+            output_path = output_dir / f"{base_name}_{size}{extension}"
+            return _render_size(source, output_path, new_width, new_height,
+                                quality, optimize, subsampling, budget_kb)
+
+        max_workers = min(len(jobs), available_cpus())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            created_files = list(executor.map(render, jobs))
+
+    return created_files, skipped_sizes
+
+
+def _probe_image_vips(input_path):
+    """Read an image header with libvips and return its (width, height)."""
+    import pyvips
+
+    img = pyvips.Image.new_from_file(str(input_path))
+    return img.width, img.height
+
+
+def _render_size_vips(input_path, output_path, new_width, new_height, quality,
+                      optimize, subsampling, budget_kb=None):
+    """Resize and save one output size with libvips and return its metadata."""
+    import pyvips
+
+    # thumbnail() picks a libjpeg shrink-on-load factor itself and streams
+    # the image through the pipeline in strips, so the full-resolution
+    # source is never held in memory. Skip EXIF auto-rotation: the target
+    # dimensions come from the stored orientation, as with Pillow.
+    img = pyvips.Image.thumbnail(str(input_path), new_width,
+                                 height=new_height, size='force',
+                                 no_rotate=True, fail_on='warning')
+    img = img.colourspace('srgb')
+    if img.hasalpha():
+        img = img.flatten(background=255)
+
+    # libvips only switches chroma subsampling on or off (4:2:0 or 4:4:4)
+    subsample_mode = 'off' if subsampling == 0 else 'on'
+
+    def encode(q):
+        return img.jpegsave_buffer(Q=q, optimize_coding=optimize,
+                                   subsample_mode=subsample_mode, strip=True)
+
+    if budget_kb is None:
+        data = encode(quality)
+    else:
+        # A sequential pipeline can only be read once, so keep the resized
+        # pixels in memory while the encoder is retried
+        img = img.copy_memory()
+        data, quality = _encode_within_budget(encode, quality, budget_kb)
+    output_path.write_bytes(data)
+
+    return OutputFile(
+        path=output_path,
+        filename=output_path.name,
+        width=new_width,
+        height=new_height,
+        size_kb=len(data) / 1024,
+        quality=quality
+    )
+
+
+def _render_sizes_vips(orig_width, orig_height, input_path, output_dir, sizes,
+                       dimension, quality, optimize, subsampling, budget_kb):
+    """Render every requested size with libvips."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs, skipped_sizes = _plan_sizes(orig_width, orig_height, sizes, dimension)
+
+    # libvips already spreads each pipeline across its own worker threads,
+    # so sizes are rendered one after another
+    created_files = []
+    for size, new_width, new_height in jobs:
+        output_path = output_dir / f"{input_path.stem}_{size}{input_path.suffix}"
+        created_files.append(_render_size_vips(
+            input_path, output_path, new_width, new_height, quality,
+            optimize, subsampling, budget_kb))
+
+    return created_files, skipped_sizes
+
+
+def resize_image(input_path, output_dir, sizes, dimension='width', quality=90,
+                 optimize=False, subsampling=2, budget_kb=None, engine='pillow'):
     """
     Resize an image to multiple sizes.
 
@@ -47,97 +361,195 @@ def resize_image(input_path, output_dir, sizes, dimension='width', quality=90):
         sizes: List of target sizes
         dimension: 'width' or 'height'
         quality: JPEG quality (1-100)
+        optimize: Run an extra pass to build optimal Huffman tables
+        subsampling: Chroma subsampling (0 = 4:4:4, 1 = 4:2:2, 2 = 4:2:0)
+        budget_kb: Maximum size per output in KB; lowers quality to fit
+        engine: 'pillow', or 'vips' to stream through libvips (needs pyvips;
+            subsampling 1 is not supported)
 
     Returns:
-        List of created files with metadata
+        Tuple of (OutputFile rows for created files, skipped sizes with reasons,
+        original (width, height))
     """
-    # Open and validate image
-    try:
-        img = Image.open(input_path)
-    except Exception as e:
+    # Run the batch pipeline for a single input so both share one error path
+    [(_, result)] = resize_images(
+        [input_path], output_dir, sizes, dimension=dimension, quality=quality,
+        optimize=optimize, subsampling=subsampling, budget_kb=budget_kb,
+        engine=engine)
+    if isinstance(result, Exception):
         print(f"Error: Cannot read image: {input_path}", file=sys.stderr)
-        print(f"Details: {e}", file=sys.stderr)
+        print(f"Details: {result}", file=sys.stderr)
         sys.exit(4)
 
-    # Get original dimensions
-    orig_width, orig_height = img.size
+    return result
 
-    # Prepare output
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Get base name and extension
-    base_name = input_path.stem
-    extension = input_path.suffix
+def resize_images(input_paths, output_dir, sizes, dimension='width', quality=90,
+                  optimize=False, subsampling=2, budget_kb=None, engine='pillow'):
+    """
+    Resize a batch of images to multiple sizes.
 
-    created_files = []
-    skipped_sizes = []
+    With the Pillow engine, a background thread decodes the next image
+    while the current one is resized and encoded. Pillow releases the GIL
+    in both stages, so the decoder and the encoders overlap. The vips engine
+    streams each image through libvips in turn.
 
-    # Process each size
-    for size in sizes:
-        # Calculate new dimensions
-        if dimension == 'width':
-            if size > orig_width:
-                skipped_sizes.append((size, f"original is only {orig_width}px wide"))
+    Args:
+        input_paths: Paths to input images
+        output_dir: Directory for output images
+        sizes: List of target sizes
+        dimension: 'width' or 'height'
+        quality: JPEG quality (1-100)
+        optimize: Run an extra pass to build optimal Huffman tables
+        subsampling: Chroma subsampling (0 = 4:4:4, 1 = 4:2:2, 2 = 4:2:0)
+        budget_kb: Maximum size per output in KB; lowers quality to fit
+        engine: 'pillow', or 'vips' to stream through libvips (needs pyvips;
+            subsampling 1 is not supported)
+
+    Yields:
+        Tuple of (input path, result) for each input, in order. The result
+        is the resize_image() tuple, or the exception raised while reading
+        the image.
+    """
+    if engine == 'vips':
+        import pyvips
+
+        for input_path in input_paths:
+            try:
+                orig_width, orig_height = _probe_image_vips(input_path)
+            except Exception as e:
+                yield input_path, e
                 continue
-            new_width = size
-            new_height = int((size / orig_width) * orig_height)
-        else:  # height
-            if size > orig_height:
-                skipped_sizes.append((size, f"original is only {orig_height}px tall"))
+
+            # libvips decodes pixels lazily, so corrupt or truncated data
+            # only surfaces while rendering
+            try:
+                created_files, skipped_sizes = _render_sizes_vips(
+                    orig_width, orig_height, input_path, output_dir, sizes,
+                    dimension, quality, optimize, subsampling, budget_kb)
+            except pyvips.Error as e:
+                yield input_path, e
                 continue
-            new_height = size
-            new_width = int((size / orig_height) * orig_width)
-
-        # Resize image using high-quality Lanczos resampling
-        resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-        # Prepare output filename
-        output_filename = f"{base_name}_{size}{extension}"
-        output_path = output_dir / output_filename
-
-        # Strip EXIF by converting to RGB if needed and not saving exif
-        if resized_img.mode in ('RGBA', 'LA', 'P'):
-            # Handle transparency by converting to RGB with white background
-            background = Image.new('RGB', resized_img.size, (255, 255, 255))
-            if resized_img.mode == 'P':
-                resized_img = resized_img.convert('RGBA')
-            background.paste(resized_img, mask=resized_img.split()[-1] if resized_img.mode in ('RGBA', 'LA') else None)
-            resized_img = background
-        elif resized_img.mode != 'RGB':
-            resized_img = resized_img.convert('RGB')
-
-        # Save without EXIF data
-        resized_img.save(output_path, 'JPEG', quality=quality, optimize=True)
-
-        # Get file size
-        file_size = get_file_size_kb(output_path)
-
-        created_files.append({
-            'path': output_path,
-            'filename': output_filename,
-            'width': new_width,
-            'height': new_height,
-            'size_kb': file_size
-        })
+            yield input_path, (created_files, skipped_sizes, (orig_width, orig_height))
+        return
+
+    decoded = queue.Queue(maxsize=2)
+
+    def decode_all():
+        for input_path in input_paths:
+            try:
+                decoded.put((input_path, _decode_image(input_path, sizes, dimension)))
+            except Exception as e:
+                decoded.put((input_path, e))
+        decoded.put(None)
+
+    threading.Thread(target=decode_all, daemon=True).start()
+
+    while True:
+        item = decoded.get()
+        if item is None:
+            return
+        input_path, result = item
+        if isinstance(result, Exception):
+            yield input_path, result
+            continue
+
+        img, (orig_width, orig_height) = result
+        created_files, skipped_sizes = _render_sizes(
+            img, orig_width, orig_height, input_path, output_dir, sizes,
+            dimension, quality, optimize, subsampling, budget_kb)
+        yield input_path, (created_files, skipped_sizes, (orig_width, orig_height))
 
-    return created_files, skipped_sizes
+
+def _print_results(input_path, args, created_files, skipped_sizes, orig_size):
+    """Print the outcome of resizing one input image."""
+    orig_width, orig_height = orig_size
+
+    # Print processing info
+    print(f"Processing: {input_path.name} ({orig_width}x{orig_height})")
+    print(f"Output directory: {args.output}")
+    print()
+
+    # Print results
+    for file_info in created_files:
+        quality_note = f", quality {file_info.quality}" if args.budget_kb else ""
+        print(f"✓ Created: {file_info.filename} "
+              f"({file_info.width}x{file_info.height}, "
+              f"{file_info.size_kb:.0f} KB{quality_note})")
+
+    # Print warnings for outputs that could not meet the size budget
+    over_budget = []
+    if args.budget_kb:
+        over_budget = [f for f in created_files if f.size_kb > args.budget_kb]
+    if over_budget:
+        print()
+        for file_info in over_budget:
+            print(f"⚠ Over budget: {file_info.filename} is "
+                  f"{file_info.size_kb:.0f} KB at quality {file_info.quality}")
+
+    # Print warnings for skipped sizes
+    if skipped_sizes:
+        print()
+        for size, reason in skipped_sizes:
+            print(f"⚠ Skipped {size}px: {reason}")
+
+    # Print summary
+    print()
+    if created_files:
+        print(f"Successfully created {len(created_files)} image(s) from {input_path.name}")
+    else:
+        print(f"Warning: No images created (all sizes would require upscaling)")
 
 
 def cmd_resize(args):
     """Handle the resize subcommand."""
-    input_path = Path(args.input)
+    if args.input_glob:
+        # Expand the pattern ourselves so it works without shell globbing
+        matches = sorted(glob.glob(args.input_glob, recursive=True))
+        if not matches:
+            print(f"Error: No files match: {args.input_glob}", file=sys.stderr)
+            sys.exit(3)
+        input_paths = [Path(m) for m in matches if validate_jpeg(Path(m))]
+        if not input_paths:
+            print(f"Error: Unsupported format. Version 1.0 supports JPEG only.", file=sys.stderr)
+            print(f"Supported extensions: .jpg, .jpeg, .JPG, .JPEG", file=sys.stderr)
+            sys.exit(1)
+
+        # Skip files already in the output directory: they are earlier
+        # outputs, and this run may overwrite them while they are read
+        output_root = Path(args.output).resolve()
+        input_paths = [p for p in input_paths
+                       if output_root not in p.resolve().parents]
+        if not input_paths:
+            print(f"Error: No input files outside the output directory match: {args.input_glob}", file=sys.stderr)
+            sys.exit(3)
+
+        # Outputs are named {stem}_{size}{ext} in one directory, so inputs
+        # with the same file name (e.g. from different subdirectories)
+        # would overwrite each other. Compare case-insensitively to cover
+        # case-insensitive filesystems.
+        seen = {}
+        for path in input_paths:
+            other = seen.setdefault(path.name.lower(), path)
+            if other is not path:
+                print(f"Error: Inputs {other} and {path} would write the same output files", file=sys.stderr)
+                print("Rename one of them or use a narrower --input-glob pattern", file=sys.stderr)
+                sys.exit(2)
+    else:
+        input_path = Path(args.input)
+
+        # Validate input file exists
+        if not input_path.exists():
+            print(f"Error: File not found: {args.input}", file=sys.stderr)
+            sys.exit(3)
 
-    # Validate input file exists
-    if not input_path.exists():
-        print(f"Error: File not found: {args.input}", file=sys.stderr)
-        sys.exit(3)
+        # Validate it's a JPEG
+        if not validate_jpeg(input_path):
+            print(f"Error: Unsupported format. Version 1.0 supports JPEG only.", file=sys.stderr)
+            print(f"Supported extensions: .jpg, .jpeg, .JPG, .JPEG", file=sys.stderr)
+            sys.exit(1)
 
-    # Validate it's a JPEG
-    if not validate_jpeg(input_path):
-        print(f"Error: Unsupported format. Version 1.0 supports JPEG only.", file=sys.stderr)
-        print(f"Supported extensions: .jpg, .jpeg, .JPG, .JPEG", file=sys.stderr)
-        sys.exit(1)
+        input_paths = [input_path]
 
     # Determine dimension and sizes
     if args.width and args.height:
@@ -158,51 +570,66 @@ def cmd_resize(args):
         print("Error: Quality must be between 1-100", file=sys.stderr)
         sys.exit(2)
 
-    # Get image dimensions for output
-    try:
-        with Image.open(input_path) as img:
-            orig_width, orig_height = img.size
-    except Exception as e:
-        print(f"Error: Cannot read image: {input_path}", file=sys.stderr)
-        sys.exit(4)
-
-    # Print processing info
-    print(f"Processing: {input_path.name} ({orig_width}x{orig_height})")
-    print(f"Output directory: {args.output}")
-    print()
+    # Validate size budget
+    if args.budget_kb is not None and args.budget_kb <= 0:
+        print("Error: Size budget must be a positive number of KB", file=sys.stderr)
+        sys.exit(2)
 
-    # Process the image
-    created_files, skipped_sizes = resize_image(
-        input_path,
+    # Validate the vips engine is usable
+    if args.engine == 'vips':
+        try:
+            import pyvips  # noqa: F401
+        except (ImportError, OSError) as e:
+            print("Error: --engine vips requires pyvips and libvips (pip install pyvips)", file=sys.stderr)
+            print(f"Details: {e}", file=sys.stderr)
+            sys.exit(2)
+        if args.subsampling == 1:
+            print("Error: --engine vips does not support 4:2:2 subsampling (use 0 or 2)", file=sys.stderr)
+            sys.exit(2)
+
+    # Refuse to run if any input would be overwritten by a planned output
+    output_dir = Path(args.output)
+    planned_outputs = {
+        (output_dir / f"{p.stem}_{size}{p.suffix}").resolve()
+        for p in input_paths for size in sizes
+    }
+    for input_path in input_paths:
+        if input_path.resolve() in planned_outputs:
+            print(f"Error: Input {input_path} would be overwritten by an output file", file=sys.stderr)
+            print("Use a different --output directory", file=sys.stderr)
+            sys.exit(2)
+
+    # Process the images
+    results = resize_images(
+        input_paths,
         args.output,
         sizes,
         dimension=dimension,
-        quality=args.quality
+        quality=args.quality,
+        optimize=args.optimize,
+        subsampling=args.subsampling,
+        budget_kb=args.budget_kb,
+        engine=args.engine
     )
 
-    # Print results
-    for file_info in created_files:
-        print(f"✓ Created: {file_info['filename']} "
-              f"({file_info['width']}x{file_info['height']}, "
-              f"{file_info['size_kb']:.0f} KB)")
+    failed = False
+    for index, (input_path, result) in enumerate(results):
+        if isinstance(result, Exception):
+            print(f"Error: Cannot read image: {input_path}", file=sys.stderr)
+            print(f"Details: {result}", file=sys.stderr)
+            failed = True
+            continue
 
-    # Print warnings for skipped sizes
-    if skipped_sizes:
-        print()
-        for size, reason in skipped_sizes:
-            print(f"⚠ Skipped {size}px: {reason}")
+        if index:
+            print()
+        _print_results(input_path, args, *result)
 
-    # Print summary
-    print()
-    if created_files:
-        print(f"Successfully created {len(created_files)} image(s) from {input_path.name}")
-    else:
-        print(f"Warning: No images created (all sizes would require upscaling)")
-        sys.exit(0)
+    if failed:
+        sys.exit(4)
 
 
-def main():
-    """Main entry point for imagepro CLI."""
+def build_parser():
+    """Build the argument parser for the imagepro CLI."""
     parser = argparse.ArgumentParser(
         description='ImagePro - Command-line tool for responsive image processing',
         epilog='Use "imagepro.py <command> --help" for more information about a command.'
@@ -232,12 +659,19 @@ def main():
         help='Comma-separated list of target heights (e.g., 400,800)'
     )
 
-    resize_parser.add_argument(
+    input_group = resize_parser.add_mutually_exclusive_group(required=True)
+
+    input_group.add_argument(
         '--input',
-        required=True,
         help='Path to input image file'
     )
 
+    input_group.add_argument(
+        '--input-glob',
+        metavar='PATTERN',
+        help='Glob pattern matching input image files (e.g., "photos/*.jpg")'
+    )
+
     resize_parser.add_argument(
         '--output',
         default='./resized/',
@@ -251,8 +685,54 @@ def main():
         help='JPEG quality 1-100 (default: 90)'
     )
 
+    resize_parser.add_argument(
+        '--budget-kb',
+        type=float,
+        help='Maximum size per output in KB; lowers quality below --quality until each file fits'
+    )
+
+    resize_parser.add_argument(
+        '--subsampling',
+        type=int,
+        choices=[0, 1, 2],
+        default=2,
+        help='JPEG chroma subsampling: 0 = 4:4:4, 1 = 4:2:2, 2 = 4:2:0 (default: 2)'
+    )
+
+    resize_parser.add_argument(
+        '--engine',
+        choices=['pillow', 'vips'],
+        default='pillow',
+        help='Image processing backend; vips streams large images in constant memory (requires pyvips) (default: pillow)'
+    )
+
+    resize_parser.add_argument(
+        '--optimize',
+        dest='optimize',
+        action='store_true',
+        help='Optimize Huffman tables for slightly smaller files (slower)'
+    )
+
+    resize_parser.add_argument(
+        '--no-optimize',
+        dest='optimize',
+        action='store_false',
+        help='Skip Huffman table optimization (default)'
+    )
+
+    resize_parser.set_defaults(optimize=False)
+
     resize_parser.set_defaults(func=cmd_resize)
 
+    return parser
+
+
+def main():
+    """Main entry point for imagepro CLI."""
+    # Pillow is imported lazily by the functions that need it, so --help,
+    # --version and argument errors return without loading it
+    parser = build_parser()
+
     # Parse arguments
     args = parser.parse_args()
 